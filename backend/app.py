@@ -1,16 +1,20 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
 import json
 import os
-from graph.dag_analyzer import DAGAnalyzer
+import threading
 from models.task import Task
 from models.virtual_machine import VirtualMachine
-from config import VMS
-from scheduler.greedy.edf_scheduler import EDFScheduler
-from scheduler.greedy.sjf_scheduler import SJFScheduler
-from scheduler.dynamic.knapsack_dp import KnapsackDPScheduler
-from graph.dag_analyzer import DAGAnalyzer
+from config import (VMS, DEFAULT_ALGORITHMS, UTILIZATION_FORMATS, DOWNSAMPLE_METHODS,
+                    UTILIZATION_DEFAULT_DOWNSAMPLE, RUN_STORE_PATH, RUN_STORE_BATCH_SIZE,
+                    RUN_STORE_FLUSH_INTERVAL, EXACT_MAX_TIME_LIMIT_MS, EXACT_MAX_TASK_SLOTS,
+                    MAX_TASK_SETS, MAX_PAYLOAD_BYTES)
+from scheduler.registry import registry
+from storage.run_store import RunStore
 app = Flask(__name__)
+# Bodies are also capped after decompression by decode_payload
+app.config['MAX_CONTENT_LENGTH'] = MAX_PAYLOAD_BYTES
 CORS(app)
 
 # Add a default route to test if server is working
@@ -22,16 +26,29 @@ def home():
         "endpoints": {
             "home": "GET /",
             "run_simulation": "POST /api/run-simulation",
-            "case_types": "GET /api/case-types"
+            "case_types": "GET /api/case-types",
+            "algorithms": "GET /api/algorithms",
+            "runs": "GET /api/runs",
+            "run": "GET /api/runs/<run_id>"
         }
     })
 
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+TASK_FILE_SUFFIX = '_tasks.json'
+
+# case_type -> (file mtime, tasks); Task objects are never mutated by the schedulers
+_task_cache = {}
+
 def load_tasks(case_type):
     """Load tasks from JSON file based on case type"""
-    filename = f"data/{case_type}_tasks.json"
-    filepath = os.path.join(os.path.dirname(__file__), filename)
+    filepath = os.path.join(DATA_DIR, f"{case_type}{TASK_FILE_SUFFIX}")
     
     try:
+        mtime = os.path.getmtime(filepath)
+        cached = _task_cache.get(case_type)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
         with open(filepath, 'r') as f:
             data = json.load(f)
         
@@ -50,6 +67,7 @@ def load_tasks(case_type):
             )
             tasks.append(task)
         
+        _task_cache[case_type] = (mtime, tasks)
         return tasks
     except FileNotFoundError:
         return []
@@ -57,59 +75,225 @@ def load_tasks(case_type):
         print(f"Error loading tasks: {e}")
         return []
 
+def list_case_types():
+    """Case types with a task file in the data directory"""
+    return sorted(name[:-len(TASK_FILE_SUFFIX)] for name in os.listdir(DATA_DIR)
+                  if name.endswith(TASK_FILE_SUFFIX))
+
+def resolve_task_sets(data):
+    """(name, tasks) pairs from a request: a case_type, inline tasks, or a task_sets list"""
+    from models.task_payload import PayloadError, parse_tasks
+    
+    bulk = 'task_sets' in data
+    entries = data['task_sets'] if bulk else [data]
+    if not isinstance(entries, list) or not entries:
+        raise PayloadError('task_sets must be a non-empty list')
+    if len(entries) > MAX_TASK_SETS:
+        raise PayloadError(f'At most {MAX_TASK_SETS} task sets per request')
+    
+    task_sets = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise PayloadError('Each task set must be an object')
+        if 'tasks' in entry:
+            name = entry.get('name') or (f'inline_{index}' if bulk else 'inline')
+            task_sets.append((str(name), parse_tasks(entry['tasks'])))
+        elif bulk and 'case_type' not in entry:
+            raise PayloadError(f'Task set {index} must have either tasks or case_type')
+        else:
+            case_type = entry.get('case_type', 'mixed')
+            tasks = load_tasks(case_type)
+            if not tasks:
+                raise PayloadError(f'No tasks found for case type: {case_type}')
+            task_sets.append((case_type, tasks))
+    return task_sets
+
+_run_store = None
+_run_store_lock = threading.Lock()
+
+def get_run_store():
+    """Open the run history store on first use"""
+    global _run_store
+    if _run_store is None:
+        with _run_store_lock:
+            if _run_store is None:
+                _run_store = RunStore(RUN_STORE_PATH, RUN_STORE_BATCH_SIZE,
+                                      RUN_STORE_FLUSH_INTERVAL)
+    return _run_store
+
+def record_run(case_type, tasks, results):
+    """Queue a run for the history store; a store failure never fails the simulation"""
+    try:
+        get_run_store().record(case_type, tasks, VMS, results)
+    except Exception as e:
+        print(f"Error recording run: {e}")
+
 def initialize_vms():
     """Initialize virtual machines from config"""
     return [VirtualMachine(vm['vm_id'], vm['total_cpu'], vm['total_ram']) for vm in VMS]
 
 @app.route('/api/run-simulation', methods=['POST'])
 def run_simulation():
+    from models.task_payload import PayloadError, decode_payload
+    
     try:
-        data = request.get_json()
-        case_type = data.get('case_type', 'mixed')
+        # JSON or msgpack body, optionally gzip-compressed
+        data = decode_payload(request.get_data(), request.content_type,
+                              request.headers.get('Content-Encoding'))
+        if not isinstance(data, dict):
+            raise PayloadError('Request body must be an object')
         
-        # Load tasks and initialize VMs
-        tasks = load_tasks(case_type)
-        if not tasks:
-            return jsonify({'error': f'No tasks found for case type: {case_type}'}), 400
+        # Optional utilization shaping: downsample long series and/or use compact arrays
+        max_points = data.get('max_points')
+        utilization_format = data.get('utilization_format', 'points')
+        downsample_method = data.get('downsample', UTILIZATION_DEFAULT_DOWNSAMPLE)
+        if max_points is not None and (not isinstance(max_points, int) or max_points < 2):
+            return jsonify({'error': 'max_points must be an integer >= 2'}), 400
+        if utilization_format not in UTILIZATION_FORMATS:
+            return jsonify({'error': f'Unknown utilization_format: {utilization_format}'}), 400
+        if downsample_method not in DOWNSAMPLE_METHODS:
+            return jsonify({'error': f'Unknown downsample method: {downsample_method}'}), 400
         
-        vms = initialize_vms()
+        # Load file-backed cases (cached) and/or validate inline task sets
+        task_sets = resolve_task_sets(data)
         
-        # Initialize schedulers - Only EDF, SJF (Greedy) and Knapsack (DP)
-        schedulers = [
-            EDFScheduler(),
-            SJFScheduler(),
-            KnapsackDPScheduler()
-        ]
+        # Algorithms are imported on first use and their instances shared across requests
+        algorithms = data.get('algorithms', DEFAULT_ALGORITHMS)
+        if isinstance(algorithms, str):
+            algorithms = [algorithms]
+        if not isinstance(algorithms, list) or not all(isinstance(name, str) for name in algorithms):
+            return jsonify({'error': 'algorithms must be a list of algorithm names'}), 400
+        # Each algorithm runs once per task set, in the order requested
+        algorithms = list(dict.fromkeys(algorithms))
+        if data.get('include_exact') and 'branch_and_bound' not in algorithms:
+            algorithms = algorithms + ['branch_and_bound']
+        available = registry.names()
+        unknown = [name for name in algorithms if name not in available]
+        if unknown or not algorithms:
+            return jsonify({'error': f'Unknown algorithms: {unknown}', 'available': available}), 400
         
-        results = {}
+        # The exact solver's memory and setup time grow with tasks x horizon
+        if 'branch_and_bound' in algorithms:
+            for case_type, tasks in task_sets:
+                task_slots = len(tasks) * max(task.deadline for task in tasks)
+                if task_slots > EXACT_MAX_TASK_SLOTS:
+                    return jsonify({'error': f'{case_type}: branch_and_bound accepts at most '
+                                             f'{EXACT_MAX_TASK_SLOTS} task-slots (tasks x latest '
+                                             f'deadline), got {task_slots}'}), 400
         
-        # Run each scheduler
-        for scheduler in schedulers:
-            # Create fresh VMs for each scheduler
-            scheduler_vms = initialize_vms()
-            result = scheduler.schedule(tasks, scheduler_vms)
-            results[scheduler.name] = result.to_dict()
+        schedulers = []
+        for name in algorithms:
+            # The exact solver only gets a dedicated instance for a non-default time limit
+            if name == 'branch_and_bound' and 'exact_time_limit_ms' in data:
+                time_limit_ms = data['exact_time_limit_ms']
+                if not isinstance(time_limit_ms, (int, float)) or time_limit_ms <= 0:
+                    return jsonify({'error': 'exact_time_limit_ms must be a positive number'}), 400
+                schedulers.append(registry.get(name, time_limit_ms=min(time_limit_ms,
+                                                                       EXACT_MAX_TIME_LIMIT_MS)))
+            else:
+                schedulers.append(registry.get(name))
         
-        response = {
-            'case_type': case_type,
-            'total_tasks': len(tasks),
-            'results': results
-        }
+        # Results are keyed by display name, which the frontend charts read, so
+        # two registered names for the same scheduler would overwrite each other
+        display_names = {}
+        for name, scheduler in zip(algorithms, schedulers):
+            display_names.setdefault(scheduler.name, []).append(name)
+        shared = [names for names in display_names.values() if len(names) > 1]
+        if shared:
+            return jsonify({'error': f'Algorithms share a result name: {shared}'}), 400
         
-        return jsonify(response)
+        # One VM fleet per scheduler, reset by schedule() and reused for every task set
+        fleets = [initialize_vms() for _ in schedulers]
+        # The exact solver runs last so the heuristics' results can seed its incumbent
+        runs_in_order = sorted(zip(algorithms, schedulers, fleets),
+                               key=lambda run: run[0] == 'branch_and_bound')
+        
+        runs = []
+        for case_type, tasks in task_sets:
+            results, seed_results = {}, {}
+            for name, scheduler, fleet in runs_in_order:
+                if name == 'branch_and_bound':
+                    result = scheduler.schedule(tasks, fleet, seed_results=seed_results)
+                else:
+                    result = seed_results[name] = scheduler.schedule(tasks, fleet)
+                results[scheduler.name] = result.to_dict(max_points, utilization_format,
+                                                         downsample_method)
+            
+            # Queued only; the store's writer thread serializes and inserts in batches
+            record_run(case_type, tasks, results)
+            
+            runs.append({
+                'case_type': case_type,
+                'total_tasks': len(tasks),
+                'results': results
+            })
+        
+        if 'task_sets' in data:
+            return jsonify({'task_sets': runs})
+        return jsonify(runs[0])
     
+    except PayloadError as e:
+        return jsonify({'error': str(e)}), 400
+    except RequestEntityTooLarge:
+        return jsonify({'error': f'Request body exceeds {MAX_PAYLOAD_BYTES} bytes'}), 413
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/algorithms', methods=['GET'])
+def get_algorithms():
+    return jsonify({
+        'algorithms': registry.names(),
+        'default': DEFAULT_ALGORITHMS
+    })
+
 @app.route('/api/case-types', methods=['GET'])
 def get_case_types():
     return jsonify({
-        'case_types': ['best', 'worst', 'mixed']
+        'case_types': list_case_types()
     })
 
+@app.route('/api/runs', methods=['GET'])
+def list_runs():
+    """Recorded runs (newest first) plus per-algorithm aggregates, with optional filters"""
+    try:
+        filters = {
+            'case_type': request.args.get('case_type'),
+            'algorithm': request.args.get('algorithm'),
+            'inputs_hash': request.args.get('inputs_hash'),
+            'since': request.args.get('since', type=float),
+            'until': request.args.get('until', type=float)
+        }
+        # SQLite treats a negative LIMIT as "no limit", so clamp to [0, 1000]
+        limit = max(0, min(request.args.get('limit', 100, type=int), 1000))
+        offset = request.args.get('offset', 0, type=int)
+        if offset < 0:
+            return jsonify({'error': 'offset must be >= 0'}), 400
+        
+        store = get_run_store()
+        store.flush()
+        return jsonify({
+            'runs': store.list_runs(limit=limit, offset=offset, **filters),
+            'aggregates': store.aggregates(**filters)
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/runs/<int:run_id>', methods=['GET'])
+def get_run(run_id):
+    """Single recorded run including its schedule"""
+    store = get_run_store()
+    store.flush()
+    run = store.get_run(run_id)
+    if run is None:
+        return jsonify({'error': f'Run not found: {run_id}'}), 404
+    return jsonify(run)
+
 @app.route('/api/analyze-dependencies/<case_type>', methods=['GET'])
 def analyze_dependencies(case_type):
     """Analyze task dependencies and graph structure"""
+    from graph.dag_analyzer import DAGAnalyzer
+    
     tasks = load_tasks(case_type)
     if not tasks:
         return jsonify({'error': f'No tasks found for case type: {case_type}'}), 400
@@ -127,6 +311,8 @@ def analyze_dependencies(case_type):
 def dependency_analysis(case_type):  # Changed function name
     """Analyze task dependencies and graph structure"""
     try:
+        from graph.dag_analyzer import DAGAnalyzer
+        
         tasks = load_tasks(case_type)
         if not tasks:
             return jsonify({'error': f'No tasks found for case type: {case_type}'}), 400
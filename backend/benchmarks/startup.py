@@ -0,0 +1,73 @@
+"""Startup-time benchmark for the Flask backend.
+
+Every measurement runs in a fresh interpreter so module caches do not hide
+import cost. Run from the backend directory:
+
+    python benchmarks/startup.py --repeat 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_APP = """
+import json, sys, time
+start = time.perf_counter()
+import app
+elapsed = time.perf_counter() - start
+heavy = [name for name in ('numpy', 'graph.dag_analyzer', 'scheduler.greedy.edf_scheduler',
+                           'scheduler.exact.branch_and_bound') if name in sys.modules]
+print(json.dumps({'import_ms': elapsed * 1000, 'preloaded': heavy}))
+"""
+
+FIRST_REQUEST = """
+import json, os, sys, tempfile, time
+import config
+config.RUN_STORE_PATH = os.path.join(tempfile.mkdtemp(), 'runs.sqlite3')
+import app
+app.RUN_STORE_PATH = config.RUN_STORE_PATH
+client = app.app.test_client()
+body = {'case_type': 'mixed', 'algorithms': sys.argv[1:]}
+timings = []
+for _ in range(2):
+    start = time.perf_counter()
+    response = client.post('/api/run-simulation', json=body)
+    timings.append((time.perf_counter() - start) * 1000)
+    assert response.status_code == 200, response.get_json()
+print(json.dumps({'cold_ms': timings[0], 'warm_ms': timings[1]}))
+"""
+
+
+def run_snippet(code, *args):
+    output = subprocess.run([sys.executable, '-c', code, *args], cwd=BACKEND_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(samples):
+    return f"median {statistics.median(samples):8.1f} ms   min {min(samples):8.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='fresh interpreters per measurement')
+    parser.add_argument('--algorithms', nargs='*', default=['edf', 'sjf', 'knapsack_dp'],
+                        help='algorithms to time on their first request')
+    args = parser.parse_args()
+
+    imports = [run_snippet(IMPORT_APP) for _ in range(args.repeat)]
+    print(f"import app                      {summarize([r['import_ms'] for r in imports])}")
+    print(f"  modules loaded at import:     {', '.join(imports[0]['preloaded']) or 'none'}")
+
+    for algorithm in args.algorithms:
+        runs = [run_snippet(FIRST_REQUEST, algorithm) for _ in range(args.repeat)]
+        print(f"first request  {algorithm:<16} {summarize([r['cold_ms'] for r in runs])}")
+        print(f"second request {algorithm:<16} {summarize([r['warm_ms'] for r in runs])}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,5 @@
+import os
+
 # Virtual Machine configurations
 VMS = [
     {"vm_id": 1, "total_cpu": 16, "total_ram": 32},
@@ -5,6 +7,40 @@ VMS = [
     {"vm_id": 3, "total_cpu": 4, "total_ram": 8}
 ]
 
+# Algorithms run when a request does not name any (keys of scheduler.registry)
+DEFAULT_ALGORITHMS = ['edf', 'sjf', 'knapsack_dp']
+
 # Simulation parameters
 MAX_TIME_SLOTS = 100
-TIME_SLOT_DURATION = 1
\ No newline at end of file
+TIME_SLOT_DURATION = 1
+
+# Inline task payloads (/api/run-simulation)
+MAX_PAYLOAD_BYTES = 64 * 1024 * 1024
+MAX_INLINE_TASKS = 10000
+MAX_TASK_SETS = 50
+# Latest accepted deadline; schedulers and utilization series allocate per time slot up to it
+MAX_TASK_DEADLINE = 10000
+
+# Utilization time series: compact encodings store percent * scale as integers
+UTILIZATION_QUANT_SCALE = 10
+UTILIZATION_FORMATS = ('points', 'columns', 'quantized', 'delta')
+DOWNSAMPLE_METHODS = ('lttb', 'minmax')
+UTILIZATION_DEFAULT_DOWNSAMPLE = 'lttb'
+
+# Run history store (SQLite, WAL mode); writes are batched on a background thread
+RUN_STORE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'run_history.sqlite3')
+RUN_STORE_BATCH_SIZE = 64
+RUN_STORE_FLUSH_INTERVAL = 0.5
+
+# Exact branch-and-bound scheduler
+EXACT_TIME_LIMIT_MS = 2000
+EXACT_MAX_TIME_LIMIT_MS = 30000
+EXACT_MEMO_LIMIT = 200000
+# Largest task count x horizon (latest deadline) the exact solver accepts
+EXACT_MAX_TASK_SLOTS = 250000
+# Cap on the bound's interval rows x tasks; fewer window boundaries are used above it
+EXACT_BOUND_MAX_CELLS = 2000000
+# Subgradient steps spent tuning the bound's Lagrange multipliers at the root
+EXACT_BOUND_ITERATIONS = 500
+# Share of the time limit for each step before the search: bound tuning, then local search
+EXACT_ROOT_STEP_SHARE = 0.25
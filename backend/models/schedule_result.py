@@ -1,3 +1,5 @@
+from config import UTILIZATION_QUANT_SCALE
+
 class ScheduleResult:
     def __init__(self, algorithm_name):
         self.algorithm_name = algorithm_name
@@ -5,17 +7,27 @@ class ScheduleResult:
         self.total_profit = 0
         self.completed_tasks = 0
         self.rejected_tasks = 0
-        self.resource_utilization = []
+        # Per-slot utilization arrays (see scheduler.utilization), encoded by to_dict
+        self.resource_utilization = None
         self.execution_time_ms = 0
         self.theoretical_complexity = ""
+        self.optimality = None
     
-    def to_dict(self):
-        return {
+    def to_dict(self, max_points=None, utilization_format='points', downsample_method='lttb'):
+        # Imported here so the model itself does not depend on the scheduler package or NumPy
+        from scheduler.utilization import format_utilization, utilization_arrays
+        
+        arrays = self.resource_utilization
+        if arrays is None:
+            arrays = utilization_arrays([], 0)
+        utilization = format_utilization(arrays, max_points, utilization_format,
+                                         downsample_method, UTILIZATION_QUANT_SCALE)
+        result = {
             'algorithm_name': self.algorithm_name,
             'total_profit': self.total_profit,
             'completed_tasks': self.completed_tasks,
             'rejected_tasks': self.rejected_tasks,
-            'resource_utilization': self.resource_utilization,
+            'resource_utilization': utilization,
             'execution_time_ms': self.execution_time_ms,
             'theoretical_complexity': self.theoretical_complexity,
             'schedule': [
@@ -28,4 +40,7 @@ class ScheduleResult:
                 }
                 for entry in self.schedule
             ]
-        }
\ No newline at end of file
+        }
+        if self.optimality is not None:
+            result['optimality'] = self.optimality
+        return result
@@ -0,0 +1,137 @@
+import json
+import zlib
+import numpy as np
+from models.task import Task
+from config import MAX_PAYLOAD_BYTES, MAX_INLINE_TASKS, MAX_TASK_DEADLINE
+
+INTEGER_FIELDS = ('arrival_time', 'cpu_cores', 'ram_gb', 'execution_time', 'deadline', 'priority')
+NUMERIC_FIELDS = INTEGER_FIELDS + ('profit',)
+MSGPACK_TYPES = ('application/msgpack', 'application/x-msgpack', 'application/vnd.msgpack')
+
+
+class PayloadError(ValueError):
+    """Request body or task set that cannot be decoded or fails validation"""
+
+
+def decode_payload(raw, content_type=None, content_encoding=None):
+    """Decode a request body that may be gzip-compressed and JSON or msgpack encoded"""
+    if content_encoding and content_encoding.lower() in ('gzip', 'deflate'):
+        # wbits=47 accepts both gzip and zlib headers; cap the output against zip bombs
+        decompressor = zlib.decompressobj(wbits=47)
+        try:
+            raw = decompressor.decompress(raw, MAX_PAYLOAD_BYTES)
+        except zlib.error as e:
+            raise PayloadError(f'Could not decompress request body: {e}')
+        if decompressor.unconsumed_tail:
+            raise PayloadError(f'Decompressed payload exceeds {MAX_PAYLOAD_BYTES} bytes')
+        if not decompressor.eof:
+            raise PayloadError('Compressed request body is truncated')
+    elif content_encoding and content_encoding.lower() != 'identity':
+        raise PayloadError(f'Unsupported Content-Encoding: {content_encoding}')
+
+    media_type = (content_type or '').split(';')[0].strip().lower()
+    try:
+        if media_type in MSGPACK_TYPES:
+            try:
+                import msgpack
+            except ImportError:
+                raise PayloadError('msgpack payloads require the optional msgpack package')
+            return msgpack.unpackb(raw, raw=False)
+        return json.loads(raw) if raw else {}
+    except PayloadError:
+        raise
+    except Exception as e:
+        raise PayloadError(f'Could not decode request body: {e}')
+
+
+def _columns(payload):
+    """Row-oriented (list of task dicts) or columnar ({field: [...]}) -> columns"""
+    if isinstance(payload, dict):
+        return payload
+    if isinstance(payload, list):
+        if not all(isinstance(row, dict) for row in payload):
+            raise PayloadError('tasks must be a list of objects or an object of columns')
+        fields = ('task_id', 'dependencies') + NUMERIC_FIELDS
+        columns = {field: [row.get(field) for row in payload] for field in fields}
+        # priority is optional per row, matching the bundled task files
+        columns['priority'] = [row.get('priority', 0) for row in payload]
+        return columns
+    raise PayloadError('tasks must be a list of objects or an object of columns')
+
+
+def parse_tasks(payload):
+    """Validate an inline task set and build Task objects.
+
+    Cells get a single type check (numbers only; JSON booleans and numeric
+    strings are rejected), then the range and integer checks run column-wise
+    with NumPy, so the cost per task is a handful of array operations.
+    """
+    columns = _columns(payload)
+    task_ids = columns.get('task_id')
+    if not isinstance(task_ids, list) or not task_ids:
+        raise PayloadError('task_id must be a non-empty list')
+    count = len(task_ids)
+    if count > MAX_INLINE_TASKS:
+        raise PayloadError(f'At most {MAX_INLINE_TASKS} tasks per task set')
+    for task_id in task_ids:
+        if isinstance(task_id, bool) or not isinstance(task_id, (str, int)):
+            raise PayloadError(f'task_id must be a string or integer, got {task_id!r}')
+    if len(set(map(str, task_ids))) != count:
+        raise PayloadError('task_id values must be unique')
+
+    values = {}
+    for field in NUMERIC_FIELDS:
+        column = columns.get(field)
+        if field == 'priority' and column is None:
+            column = [0] * count
+        if not isinstance(column, list) or len(column) != count:
+            raise PayloadError(f'{field} must be a list of {count} numbers')
+        for index, value in enumerate(column):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise PayloadError(f'Task {task_ids[index]!r}: {field} must be a number, '
+                                   f'got {value!r}')
+        try:
+            values[field] = np.asarray(column, dtype=float)
+        except OverflowError:
+            raise PayloadError(f'{field} contains a number out of range')
+
+    checks = [(np.isfinite(values[field]), f'{field} must be finite') for field in NUMERIC_FIELDS]
+    checks += [(values[field] == np.floor(values[field]), f'{field} must be an integer')
+               for field in INTEGER_FIELDS]
+    checks += [
+        (values['arrival_time'] >= 0, 'arrival_time must be >= 0'),
+        (values['cpu_cores'] > 0, 'cpu_cores must be > 0'),
+        (values['ram_gb'] > 0, 'ram_gb must be > 0'),
+        (values['execution_time'] > 0, 'execution_time must be > 0'),
+        (values['profit'] >= 0, 'profit must be >= 0'),
+        (values['deadline'] >= values['arrival_time'], 'deadline must be >= arrival_time'),
+        (values['deadline'] <= MAX_TASK_DEADLINE, f'deadline must be <= {MAX_TASK_DEADLINE}')
+    ]
+    for valid, message in checks:
+        if not valid.all():
+            index = int(np.argmin(valid))
+            raise PayloadError(f'Task {task_ids[index]!r}: {message}')
+
+    dependencies = columns.get('dependencies') or [None] * count
+    if not isinstance(dependencies, list) or len(dependencies) != count:
+        raise PayloadError(f'dependencies must be a list of {count} lists')
+    for task_id, entry in zip(task_ids, dependencies):
+        if entry is not None and not isinstance(entry, list):
+            raise PayloadError(f'Task {task_id!r}: dependencies must be a list or null')
+
+    ints = {field: values[field].astype(np.int64).tolist() for field in INTEGER_FIELDS}
+    profits = values['profit'].tolist()
+    return [
+        Task(
+            task_id=task_ids[i],
+            arrival_time=ints['arrival_time'][i],
+            cpu_cores=ints['cpu_cores'][i],
+            ram_gb=ints['ram_gb'][i],
+            execution_time=ints['execution_time'][i],
+            deadline=ints['deadline'][i],
+            priority=ints['priority'][i],
+            profit=int(profits[i]) if profits[i].is_integer() else profits[i],
+            dependencies=list(dependencies[i] or [])
+        )
+        for i in range(count)
+    ]
@@ -1,12 +1,13 @@
 import time
 from models.virtual_machine import VirtualMachine
+from scheduler.utilization import utilization_arrays
 
 class BaseScheduler:
     def __init__(self, name, complexity):
         self.name = name
         self.theoretical_complexity = complexity
     
-    def schedule(self, tasks, vms):
+    def schedule(self, tasks, vms, **options):
         start_time = time.time() * 1000  # ms
         
         # Reset VMs
@@ -14,7 +15,8 @@ class BaseScheduler:
             vm.reset()
         
         # Implement scheduling logic in child classes
-        result = self._schedule_tasks(tasks, vms)
+        # options are scheduler-specific, e.g. seed_results for the exact solver
+        result = self._schedule_tasks(tasks, vms, **options)
         
         # Calculate execution time
         result.execution_time_ms = time.time() * 1000 - start_time
@@ -95,34 +97,9 @@ class BaseScheduler:
                 end_time <= task.deadline)
     
     def calculate_utilization(self, vms, max_time):
-        utilization = []
-        for time_slot in range(max_time):
-            total_cpu_used = 0
-            total_ram_used = 0
-            total_cpu = 0
-            total_ram = 0
-            
-            for vm in vms:
-                total_cpu += vm.total_cpu
-                total_ram += vm.total_ram
-                
-                cpu_used = 0
-                ram_used = 0
-                
-                for scheduled in vm.scheduled_tasks:
-                    if scheduled['start_time'] <= time_slot < scheduled['end_time']:
-                        cpu_used += scheduled['task'].cpu_cores
-                        ram_used += scheduled['task'].ram_gb
-                
-                total_cpu_used += cpu_used
-                total_ram_used += ram_used
-            
-            cpu_util = (total_cpu_used / total_cpu) * 100 if total_cpu > 0 else 0
-            ram_util = (total_ram_used / total_ram) * 100 if total_ram > 0 else 0
-            avg_util = (cpu_util + ram_util) / 2
-            utilization.append({'time': time_slot, 'cpu': cpu_util, 'ram': ram_util, 'avg': avg_util})
-        
-        return utilization
+        """Cluster utilization per time slot as NumPy arrays; ScheduleResult.to_dict
+        downsamples and encodes them for the response"""
+        return utilization_arrays(vms, max_time)
     
     def can_execute_with_dependencies(self, task, executed_tasks):
         """Check if all dependencies of a task are satisfied"""
@@ -0,0 +1,585 @@
+import hashlib
+import random
+import time
+import numpy as np
+from scheduler.base_scheduler import BaseScheduler
+from scheduler.registry import registry
+from models.schedule_result import ScheduleResult
+from models.virtual_machine import VirtualMachine
+from config import (EXACT_TIME_LIMIT_MS, EXACT_MEMO_LIMIT, EXACT_MAX_TASK_SLOTS,
+                    EXACT_BOUND_MAX_CELLS, EXACT_BOUND_ITERATIONS, EXACT_ROOT_STEP_SHARE)
+
+GREEDY_INCUMBENTS = ('edf', 'sjf', 'knapsack_dp')
+
+class BranchAndBoundScheduler(BaseScheduler):
+    """Anytime exact scheduler: depth-first branch-and-bound over accept/VM/start.
+
+    Tasks are decided in order of decreasing profit. Each node is bounded by
+    the smaller of two Lagrangian relaxations whose multipliers are tuned once
+    at the root: an interval (energetic) one, where for every group of VMs some
+    tasks are confined to by their size and every interval between task window
+    boundaries the remaining tasks' minimum CPU and RAM use must fit the
+    capacity they could still use there, and a per-VM, per-slot one that prices
+    each VM's capacity in every time slot. The search starts from the best
+    greedy or list-scheduling incumbent, improved by local search, and stops at
+    the time limit, reporting the incumbent, the proven upper bound and the
+    relative gap.
+
+    time_limit_ms covers the whole schedule() call: the greedy seeds, the
+    list-scheduling passes and the search. A heuristic that is already running
+    when the limit expires is allowed to finish, so very large inputs can
+    overrun it by the cost of one greedy pass. Passing seed_results (a dict of
+    registry name -> ScheduleResult for the same tasks, e.g. from earlier in the
+    same request) adds them as incumbents and skips re-running those
+    heuristics. Inputs above
+    EXACT_MAX_TASK_SLOTS (tasks x latest deadline) are rejected with a
+    ValueError, since the solver's memory and setup time grow with both.
+    """
+
+    def __init__(self, time_limit_ms=EXACT_TIME_LIMIT_MS, memo_limit=EXACT_MEMO_LIMIT):
+        super().__init__("Branch and Bound (Exact)", "O(b^n) worst case, bound-pruned")
+        self.time_limit_ms = time_limit_ms
+        self.memo_limit = memo_limit
+
+    def _schedule_tasks(self, tasks, vms, seed_results=None):
+        result = ScheduleResult(self.name)
+
+        if not tasks:
+            return result
+
+        task_slots = len(tasks) * max(task.deadline for task in tasks)
+        if task_slots > EXACT_MAX_TASK_SLOTS:
+            raise ValueError(f"Exact solver accepts at most {EXACT_MAX_TASK_SLOTS} task-slots "
+                             f"(tasks x latest deadline), got {task_slots}")
+
+        max_time = max(task.deadline for task in tasks) + 50
+        search = _Search(tasks, vms, self.time_limit_ms / 1000, self.memo_limit)
+        search.seed_incumbent(self._greedy_incumbents(tasks, vms, search.deadline,
+                                                        seed_results or {}))
+        search.seed_list_schedules()
+        search.optimize_multipliers()
+        search.improve_incumbent()
+        search.run()
+
+        vm_by_index = list(vms)
+        for task_index, (vm_index, start_time) in sorted(search.best_assignment.items(),
+                                                         key=lambda item: item[1][1]):
+            task = tasks[task_index]
+            vm = vm_by_index[vm_index]
+            entry = {
+                'task': task,
+                'start_time': start_time,
+                'end_time': start_time + task.execution_time,
+                'vm_id': vm.vm_id
+            }
+            # Feasibility is enforced per time slot by the search itself
+            vm.scheduled_tasks.append(entry)
+            result.schedule.append(entry)
+            result.total_profit += task.profit
+            result.completed_tasks += 1
+
+        result.rejected_tasks = len(tasks) - result.completed_tasks
+        result.resource_utilization = self.calculate_utilization(vms, max_time)
+        result.optimality = search.report()
+        return result
+
+    def _greedy_incumbents(self, tasks, vms, deadline, seed_results):
+        """The caller's seed results plus any GREEDY_INCUMBENTS heuristics they
+        don't cover, run on scratch copies of the VMs"""
+        results = list(seed_results.values())
+        for name in GREEDY_INCUMBENTS:
+            if name in seed_results:
+                continue
+            if time.perf_counter() > deadline:
+                break
+            scratch = [VirtualMachine(vm.vm_id, vm.total_cpu, vm.total_ram) for vm in vms]
+            results.append(registry.get(name).schedule(tasks, scratch))
+        return results
+
+
+class _Search:
+    def __init__(self, tasks, vms, time_limit_s, memo_limit):
+        self.time_limit_s = time_limit_s
+        self.started = time.perf_counter()
+        self.deadline = self.started + time_limit_s
+        self.memo_limit = memo_limit
+        self.horizon = max(task.deadline for task in tasks)
+        self.vm_ids = [vm.vm_id for vm in vms]
+        self.cap_cpu = np.array([vm.total_cpu for vm in vms], dtype=np.int64)
+        self.cap_ram = np.array([vm.total_ram for vm in vms], dtype=np.int64)
+        self.free_cpu = np.repeat(self.cap_cpu[:, None], self.horizon, axis=1)
+        self.free_ram = np.repeat(self.cap_ram[:, None], self.horizon, axis=1)
+        self.tasks = tasks
+
+        # Tasks that cannot be placed even on an empty fleet never enter the search, and
+        # neither do tasks without positive profit: the accept-dominance rule and the
+        # Lagrangian bound both assume accepting a task never lowers the profit
+        candidates = [i for i, task in enumerate(tasks)
+                      if task.profit > 0 and self._placements(task)]
+        self.order = sorted(candidates, key=lambda i: (-tasks[i].profit, tasks[i].deadline))
+        self._precompute_bounds()
+
+        self.assignment = {}
+        self.best_assignment = {}
+        self.best_profit = 0
+        self.incumbent_source = None
+        self.nodes = 0
+        self.memo = {}
+        self.timed_out = False
+        self.upper_bound = None
+        self.root_bound = float('inf')
+        self.best_list = None
+        self.greedy_profits = {}
+
+    def _precompute_bounds(self):
+        """Coverage, demand extremes and the Lagrangian relaxations of the node bound.
+
+        Slot t of a VM is covered at depth d when some task in order[d:] that
+        fits the VM could run there. last_use keeps the deepest such task per
+        VM and slot, so coverage at any depth is last_use >= d.
+        """
+        n = len(self.order)
+        vm_count = len(self.vm_ids)
+        order = np.array(self.order, dtype=np.int64)
+        arrival = np.array([t.arrival_time for t in self.tasks], dtype=np.int64)[order]
+        deadline = np.array([t.deadline for t in self.tasks], dtype=np.int64)[order]
+        duration = np.array([t.execution_time for t in self.tasks], dtype=np.int64)[order]
+        self.cpu = np.array([t.cpu_cores for t in self.tasks], dtype=float)[order]
+        self.ram = np.array([t.ram_gb for t in self.tasks], dtype=float)[order]
+        self.profit = np.array([t.profit for t in self.tasks], dtype=float)[order]
+        self.fits = (self.cpu[:, None] <= self.cap_cpu) & (self.ram[:, None] <= self.cap_ram)
+        self.fleet = (float(self.cap_cpu.sum()), float(self.cap_ram.sum()))
+
+        self.last_use = np.full((vm_count, self.horizon), -1, dtype=np.int64)
+        for depth in range(n):
+            self.last_use[self.fits[depth], arrival[depth]:deadline[depth]] = depth
+        # Smallest and largest demand among remaining tasks that fit each VM
+        self.min_demand = np.full((n + 1, 2, vm_count), np.inf)
+        self.max_demand = np.zeros((n + 1, 2, vm_count))
+        for depth in range(n - 1, -1, -1):
+            demand = np.array([[self.cpu[depth]], [self.ram[depth]]])
+            fits = self.fits[depth]
+            self.min_demand[depth] = np.where(fits, np.minimum(self.min_demand[depth + 1], demand),
+                                              self.min_demand[depth + 1])
+            self.max_demand[depth] = np.where(fits, np.maximum(self.max_demand[depth + 1], demand),
+                                              self.max_demand[depth + 1])
+
+        self._precompute_interval_rows(arrival, deadline, duration)
+        self._precompute_starts(arrival, deadline, duration)
+        self.interval_multipliers = np.zeros(len(self.weights))
+        self.interval_suffix = self._suffix(self.profit)
+        self.slot_prices = np.zeros((2, vm_count, self.horizon))
+        self.slot_suffix = self._suffix(self.profit)
+
+    def _precompute_interval_rows(self, arrival, deadline, duration):
+        """Rows of the interval (energetic) relaxation.
+
+        One row per resource, VM group and interval: the minimum CPU or RAM
+        time a task must spend in the interval, for the tasks confined to the
+        group. Groups are the fleet and each set of VMs some task fits, since a
+        task whose fitting VMs all lie in a group can only use its capacity.
+        Intervals run between task window boundaries, thinned so that rows x
+        tasks stays under EXACT_BOUND_MAX_CELLS.
+        """
+        n = len(self.order)
+        groups = np.unique(np.vstack([self.fits, np.ones((1, len(self.vm_ids)), dtype=bool)]), axis=0)
+        members = ~(self.fits[None, :, :] & ~groups[:, None, :]).any(axis=2)
+        self.groups = groups.astype(float)
+
+        points = np.unique(np.concatenate([arrival, deadline]))
+        max_intervals = EXACT_BOUND_MAX_CELLS // (2 * len(groups) * max(n, 1))
+        max_points = max(int((1 + np.sqrt(1 + 8 * max_intervals)) / 2), 2)
+        if len(points) > max_points:
+            points = np.unique(points[np.linspace(0, len(points) - 1, max_points).round().astype(np.int64)])
+        lo_index, hi_index = np.triu_indices(len(points), 1)
+        self.intervals = np.stack([points[lo_index], points[hi_index]], axis=1)
+
+        # Minimum time any placement of a task must spend inside each interval
+        lo, hi = self.intervals[:, 0:1], self.intervals[:, 1:2]
+        left = np.minimum(hi, arrival + duration) - np.maximum(lo, arrival)
+        right = np.minimum(hi, deadline) - np.maximum(lo, deadline - duration)
+        overlap = np.clip(np.minimum(left, right), 0, None)
+        energy = (members[:, None, :] * overlap[None, :, :]).reshape(len(groups) * len(overlap), n)
+        self.weights = np.concatenate([energy * self.cpu, energy * self.ram])
+
+    def _precompute_starts(self, arrival, deadline, duration):
+        """Every start time of every task on an empty fleet, for the slot relaxation"""
+        counts = deadline - duration - arrival + 1
+        self.start_task = np.repeat(np.arange(len(counts)), counts)
+        self.start_first = np.cumsum(counts) - counts
+        offset = np.arange(len(self.start_task)) - self.start_first[self.start_task]
+        self.start_time = arrival[self.start_task] + offset
+        self.start_end = self.start_time + duration[self.start_task]
+
+    @staticmethod
+    def _suffix(reduced):
+        """Suffix sums of the positive reduced profits, indexed by depth"""
+        return np.concatenate([np.cumsum(np.clip(reduced, 0, None)[::-1])[::-1], [0.0]])
+
+    def _usable_capacity(self, depth):
+        """Free CPU/RAM per VM and slot that the remaining tasks could actually fill.
+
+        At most min(free_cpu // min_cpu, free_ram // min_ram) of them can run
+        together, and each uses no more than the largest remaining demand.
+        """
+        covered = self.last_use >= depth
+        min_cpu, min_ram = (self.min_demand[depth, 0][:, None], self.min_demand[depth, 1][:, None])
+        max_cpu, max_ram = (self.max_demand[depth, 0][:, None], self.max_demand[depth, 1][:, None])
+        concurrent = np.minimum(self.free_cpu // min_cpu, self.free_ram // min_ram)
+        concurrent = np.where(covered, concurrent, 0)
+        return np.stack([np.minimum(self.free_cpu, concurrent * max_cpu),
+                         np.minimum(self.free_ram, concurrent * max_ram)])
+
+    def _interval_capacity(self, usable):
+        """Right-hand side of every interval row"""
+        lo, hi = self.intervals[:, 0], self.intervals[:, 1]
+        prefix = np.concatenate([np.zeros(usable.shape[:2] + (1,)), np.cumsum(usable, axis=2)], axis=2)
+        grouped = self.groups @ prefix
+        return (grouped[:, :, hi] - grouped[:, :, lo]).ravel()
+
+    def _interval_relaxation(self, multipliers, capacity):
+        """Lagrangian value and subgradient of the interval relaxation"""
+        reduced = self.profit - multipliers @ self.weights
+        taken = reduced > 0
+        return reduced[taken].sum() + multipliers @ capacity, capacity - self.weights @ taken
+
+    def _slot_relaxation(self, prices, capacity):
+        """Lagrangian value and subgradient of the per-VM, per-slot relaxation.
+
+        With CPU and RAM priced per VM and slot, each task independently takes
+        its cheapest start on any VM it fits, and is worth taking when its
+        profit exceeds that price.
+        """
+        prices = prices.reshape(capacity.shape)
+        prefix = np.concatenate([np.zeros(prices.shape[:2] + (1,)), np.cumsum(prices, axis=2)], axis=2)
+        task, start, end = self.start_task, self.start_time, self.start_end
+        cost = (self.cpu[task] * (prefix[0][:, end] - prefix[0][:, start]) +
+                self.ram[task] * (prefix[1][:, end] - prefix[1][:, start]))
+        cost[~self.fits[task].T] = np.inf
+        vm_choice = np.argmin(cost, axis=0)
+        cost = cost[vm_choice, np.arange(len(task))]
+        cheapest = np.minimum.reduceat(cost, self.start_first)
+        reduced = self.profit - cheapest
+        # First cheapest start of every task worth taking
+        chosen = np.flatnonzero((cost == cheapest[task]) & (reduced > 0)[task])
+        chosen = chosen[np.unique(task[chosen], return_index=True)[1]]
+
+        usage = np.zeros(capacity.shape[:2] + (capacity.shape[2] + 1,))
+        for resource, demand in enumerate((self.cpu, self.ram)):
+            np.add.at(usage[resource], (vm_choice[chosen], start[chosen]), demand[task[chosen]])
+            np.add.at(usage[resource], (vm_choice[chosen], end[chosen]), -demand[task[chosen]])
+        usage = np.cumsum(usage, axis=2)[:, :, :-1]
+        value = np.clip(reduced, 0, None).sum() + (prices * capacity).sum()
+        return value, (capacity - usage).ravel(), reduced
+
+    def _bound(self, depth):
+        """Upper bound on the profit still obtainable from tasks order[depth:].
+
+        Weak duality: for any multipliers >= 0, the positive reduced profits
+        plus the priced capacity bound each relaxation; the smaller one is used.
+        """
+        if depth >= len(self.order):
+            return 0.0
+        usable = self._usable_capacity(depth)
+        interval = self.interval_suffix[depth] + self.interval_multipliers @ self._interval_capacity(usable)
+        slot = self.slot_suffix[depth] + (self.slot_prices * usable).sum()
+        return float(min(interval, slot))
+
+    def _subgradient(self, relaxation, size, stop):
+        """Minimize a Lagrangian bound over multipliers >= 0.
+
+        Any non-negative multipliers give a valid bound, so stopping early only
+        loosens it. Polyak steps aim at the incumbent and shrink when the bound
+        stops improving.
+        """
+        multipliers = np.zeros(size)
+        best_value, best_multipliers = None, multipliers
+        step_scale, stalled = 2.0, 0
+        for iteration in range(EXACT_BOUND_ITERATIONS):
+            if iteration >= 10 and time.perf_counter() > stop:
+                break
+            value, gradient = relaxation(multipliers)[:2]
+            if best_value is None or value < best_value - 1e-9:
+                best_value, best_multipliers, stalled = value, multipliers, 0
+            else:
+                stalled += 1
+                if stalled >= 10:
+                    step_scale, stalled = step_scale / 2, 0
+            norm = gradient @ gradient
+            if value <= self.best_profit or norm == 0:
+                break
+            step = step_scale * (value - self.best_profit) / norm
+            multipliers = np.maximum(multipliers - step * gradient, 0)
+        return best_multipliers
+
+    def optimize_multipliers(self):
+        """Tune both relaxations at the root, splitting a share of the time limit"""
+        if not self.order:
+            self.root_bound = 0.0
+            return
+        now = time.perf_counter()
+        stop = min(self.deadline, now + self.time_limit_s * EXACT_ROOT_STEP_SHARE)
+        usable = self._usable_capacity(0)
+
+        capacity = self._interval_capacity(usable)
+        self.interval_multipliers = self._subgradient(
+            lambda multipliers: self._interval_relaxation(multipliers, capacity),
+            len(capacity), (now + stop) / 2)
+        self.interval_suffix = self._suffix(self.profit - self.interval_multipliers @ self.weights)
+
+        prices = self._subgradient(lambda prices: self._slot_relaxation(prices, usable),
+                                   usable.size, stop)
+        self.slot_prices = prices.reshape(usable.shape)
+        self.slot_suffix = self._suffix(self._slot_relaxation(prices, usable)[2])
+        self.root_bound = self._bound(0)
+
+    def _placements(self, task):
+        """Feasible (vm_index, start) pairs under the current occupancy"""
+        last_start = task.deadline - task.execution_time
+        if last_start < task.arrival_time or task.execution_time <= 0:
+            return []
+        window = slice(task.arrival_time, task.deadline)
+        # A start is feasible when no slot it would occupy lacks CPU or RAM
+        blocked = ((self.free_cpu[:, window] < task.cpu_cores) |
+                   (self.free_ram[:, window] < task.ram_gb)).cumsum(axis=1)
+        blocked = np.concatenate([np.zeros((len(blocked), 1), dtype=blocked.dtype), blocked], axis=1)
+        vm_index, offset = np.nonzero(blocked[:, task.execution_time:] ==
+                                      blocked[:, :-task.execution_time])
+        return list(zip(vm_index.tolist(), (offset + task.arrival_time).tolist()))
+
+    def _distinct_placements(self, depth, task):
+        """Drop placements that leave the future search in an identical state.
+
+        Only slots some later task could use on that VM ("covered") matter, so two starts on
+        the same VM are equivalent when they overlap the same covered slots, and
+        VMs with the same capacity and covered occupancy are interchangeable.
+        Returns (placements, dominant) where dominant means the placement touches
+        no covered slot and so is at least as good as any alternative.
+        """
+        covered_by_vm = self.last_use > depth
+        prefix_by_vm = np.concatenate([np.zeros((len(covered_by_vm), 1), dtype=np.int64),
+                                       np.cumsum(covered_by_vm, axis=1)], axis=1)
+        vm_keys = {}
+        seen = set()
+        distinct = []
+        for vm_index, start in sorted(self._placements(task), key=lambda p: (p[1], p[0])):
+            end = start + task.execution_time
+            covered = covered_by_vm[vm_index]
+            prefix = prefix_by_vm[vm_index]
+            if prefix[end] == prefix[start]:
+                return [(vm_index, start)], True
+            if vm_index not in vm_keys:
+                vm_keys[vm_index] = (int(self.cap_cpu[vm_index]), int(self.cap_ram[vm_index]),
+                                     covered.tobytes(),
+                                     self.free_cpu[vm_index, covered].tobytes(),
+                                     self.free_ram[vm_index, covered].tobytes())
+            first = start + int(np.argmax(covered[start:end]))
+            last = end - 1 - int(np.argmax(covered[start:end][::-1]))
+            key = (vm_keys[vm_index], first, last)
+            if key not in seen:
+                seen.add(key)
+                distinct.append((vm_index, start))
+        return distinct, False
+
+    def _state_key(self, depth):
+        covered = self.last_use >= depth
+        digest = hashlib.blake2b(self.free_cpu[covered].tobytes(), digest_size=16)
+        digest.update(self.free_ram[covered].tobytes())
+        return depth, digest.digest()
+
+    def _apply(self, task_index, vm_index, start, sign):
+        task = self.tasks[task_index]
+        end = start + task.execution_time
+        self.free_cpu[vm_index, start:end] -= sign * task.cpu_cores
+        self.free_ram[vm_index, start:end] -= sign * task.ram_gb
+
+    def _list_schedule(self, order, placement_key):
+        """Place tasks in the given order at their best feasible placement"""
+        assignment, profit = {}, 0
+        for i in order:
+            options = self._placements(self.tasks[i])
+            if options:
+                v, start = min(options, key=placement_key)
+                self._apply(i, v, start, 1)
+                assignment[i] = (v, start)
+                profit += self.tasks[i].profit
+        for i, (v, start) in assignment.items():
+            self._apply(i, v, start, -1)
+        return assignment, profit
+
+    def seed_list_schedules(self):
+        """Slot-aware list scheduling under a few task orders and VM choices"""
+        fleet_cpu, fleet_ram = self.fleet
+        orders = {
+            'profit': lambda t: -t.profit,
+            'profit density': lambda t: -t.profit / (t.execution_time * (t.cpu_cores / fleet_cpu +
+                                                                         t.ram_gb / fleet_ram)),
+            'profit rate': lambda t: -t.profit / t.execution_time,
+            'deadline': lambda t: (t.deadline, -t.profit),
+            'shortest job': lambda t: (t.execution_time, -t.profit)
+        }
+        placements = {
+            'earliest start': lambda p: (p[1], p[0]),
+            'best fit': lambda p: (int(self.cap_cpu[p[0]] * self.cap_ram[p[0]]), p[1])
+        }
+        schedules = []
+        for order_name, order_key in orders.items():
+            for placement_name, placement_key in placements.items():
+                if time.perf_counter() > self.deadline:
+                    break
+                order = sorted(self.order, key=lambda i: order_key(self.tasks[i]))
+                assignment, profit = self._list_schedule(order, placement_key)
+                schedules.append((f'list scheduling ({order_name}, {placement_name})',
+                                  assignment, profit))
+                if self.best_list is None or profit > self.best_list[2]:
+                    self.best_list = (order, placement_key, profit)
+        self._keep_best(schedules)
+
+    def improve_incumbent(self):
+        """Local search over the best list-scheduling order.
+
+        Each move either pulls a rejected task to an earlier position or moves
+        one to three random tasks, and the new order is kept when it schedules
+        at least as much profit. Runs for a share of the time limit, until the
+        incumbent reaches the root bound, or until 10 moves per task in a row
+        bring no improvement.
+        """
+        if self.best_list is None or len(self.order) < 2:
+            return
+        stop = min(self.deadline, time.perf_counter() + self.time_limit_s * EXACT_ROOT_STEP_SHARE)
+        order, placement_key, profit = self.best_list
+        assignment, _ = self._list_schedule(order, placement_key)
+        rng = random.Random(0)
+        stalled = 0
+        while (time.perf_counter() < stop and self.best_profit < self.root_bound and
+               stalled < 10 * len(order)):
+            candidate = list(order)
+            rejected = [position for position, i in enumerate(order) if i not in assignment]
+            if rejected and rng.random() < 0.5:
+                position = rng.choice(rejected)
+                candidate.insert(rng.randrange(position + 1), candidate.pop(position))
+            else:
+                for _ in range(rng.randint(1, 3)):
+                    candidate.insert(rng.randrange(len(candidate)), candidate.pop(rng.randrange(len(candidate))))
+            candidate_assignment, candidate_profit = self._list_schedule(candidate, placement_key)
+            stalled = 0 if candidate_profit > profit else stalled + 1
+            if candidate_profit >= profit:
+                order, assignment, profit = candidate, candidate_assignment, candidate_profit
+                if profit > self.best_profit:
+                    self._keep_best([('local search', assignment, profit)])
+
+    def _keep_best(self, schedules):
+        for name, assignment, profit in schedules:
+            if profit > self.best_profit or self.incumbent_source is None:
+                self.best_profit = profit
+                self.best_assignment = assignment
+                self.incumbent_source = name
+
+    def seed_incumbent(self, greedy_results):
+        """Best greedy schedule, after dropping entries that overcommit a VM.
+
+        The heuristics track VM capacity cumulatively rather than per time slot,
+        so their schedules are replayed slot by slot and conflicting entries are
+        dropped before they can serve as an incumbent. Each heuristic's reported
+        and feasible profit is kept for report().
+        """
+        task_index = {id(task): i for i, task in enumerate(self.tasks)}
+        vm_index = {vm_id: i for i, vm_id in enumerate(self.vm_ids)}
+        repaired = []
+        for greedy in greedy_results:
+            assignment, profit = {}, 0
+            for entry in greedy.schedule:
+                i, v = task_index.get(id(entry['task'])), vm_index.get(entry['vm_id'])
+                start, end = entry['start_time'], entry['end_time']
+                # Seeds come from the caller, so skip entries for other tasks or VMs
+                if (i is None or v is None or end <= start or start < 0 or end > self.horizon or
+                        self.free_cpu[v, start:end].min() < entry['task'].cpu_cores or
+                        self.free_ram[v, start:end].min() < entry['task'].ram_gb):
+                    continue
+                self._apply(i, v, start, 1)
+                assignment[i] = (v, start)
+                profit += entry['task'].profit
+            for i, (v, start) in assignment.items():
+                self._apply(i, v, start, -1)
+            self.greedy_profits[greedy.algorithm_name] = (greedy.total_profit, profit)
+            # Tasks without positive profit only lower the incumbent, so leave them out
+            kept = {i: placement for i, placement in assignment.items()
+                    if self.tasks[i].profit > 0}
+            repaired.append((greedy.algorithm_name, kept,
+                             sum(self.tasks[i].profit for i in kept)))
+        self._keep_best(repaired)
+
+    def run(self):
+        self.timed_out = time.perf_counter() > self.deadline
+        subtree_bound = self._search(0, 0)
+        self.upper_bound = max(self.best_profit, subtree_bound)
+        self.elapsed_ms = (time.perf_counter() - self.started) * 1000
+
+    def _search(self, depth, profit):
+        """Explore order[depth:]; return an upper bound on any completion found below"""
+        self.nodes += 1
+        if depth == len(self.order):
+            if profit > self.best_profit:
+                self.best_profit = profit
+                self.best_assignment = dict(self.assignment)
+                self.incumbent_source = 'branch-and-bound'
+            return profit
+
+        node_bound = profit + self._bound(depth)
+        if node_bound <= self.best_profit:
+            return node_bound
+        if self.timed_out or (self.nodes & 255 == 0 and time.perf_counter() > self.deadline):
+            self.timed_out = True
+            return node_bound
+
+        # A state reached before with at least this much profit dominates this one
+        key = self._state_key(depth)
+        if self.memo.get(key, -1) >= profit:
+            return profit
+        if len(self.memo) < self.memo_limit:
+            self.memo[key] = profit
+
+        task_index = self.order[depth]
+        task = self.tasks[task_index]
+        placements, dominant = self._distinct_placements(depth, task)
+        best = profit
+        for vm_index, start in placements:
+            if self.timed_out:
+                return max(best, node_bound)
+            self._apply(task_index, vm_index, start, 1)
+            self.assignment[task_index] = (vm_index, start)
+            best = max(best, self._search(depth + 1, profit + task.profit))
+            del self.assignment[task_index]
+            self._apply(task_index, vm_index, start, -1)
+
+        if not dominant:
+            if self.timed_out:
+                return max(best, node_bound)
+            best = max(best, self._search(depth + 1, profit))
+        return best
+
+    def report(self):
+        bound = max(self.upper_bound, self.best_profit)
+        gap = (bound - self.best_profit) / bound if bound > 0 else 0.0
+        # Raw greedy profits can exceed the bound because those schedules overcommit
+        # VMs; the feasible profit is what survives a per-slot capacity replay
+        greedy_profits = {
+            name: {
+                'reported_profit': reported,
+                'feasible_profit': feasible,
+                'gap': float((bound - feasible) / bound) if bound > 0 else 0.0
+            }
+            for name, (reported, feasible) in self.greedy_profits.items()
+        }
+        return {
+            'incumbent_profit': self.best_profit,
+            'upper_bound': float(bound),
+            'gap': float(gap),
+            'proven_optimal': bool(not self.timed_out or gap == 0),
+            'incumbent_source': self.incumbent_source,
+            'nodes': self.nodes,
+            'greedy_profits': greedy_profits,
+            'elapsed_ms': self.elapsed_ms,
+            'time_limit_ms': self.time_limit_s * 1000,
+            'timed_out': self.timed_out
+        }
@@ -0,0 +1,92 @@
+import importlib
+import threading
+from importlib import metadata
+
+# Built-in algorithms as "module:Class" targets; nothing is imported until first use
+BUILTIN_SCHEDULERS = {
+    'edf': 'scheduler.greedy.edf_scheduler:EDFScheduler',
+    'sjf': 'scheduler.greedy.sjf_scheduler:SJFScheduler',
+    'knapsack_dp': 'scheduler.dynamic.knapsack_dp:KnapsackDPScheduler',
+    'branch_and_bound': 'scheduler.exact.branch_and_bound:BranchAndBoundScheduler'
+}
+
+# Installed packages can add schedulers under this entry-point group, e.g.
+#   [project.entry-points."cloud_scheduler.schedulers"]
+#   my_algo = "my_package.scheduler:MyScheduler"
+ENTRY_POINT_GROUP = 'cloud_scheduler.schedulers'
+
+
+def _entry_points(group):
+    try:
+        return metadata.entry_points(group=group)
+    except TypeError:
+        # Python < 3.10 returns a dict keyed by group
+        return metadata.entry_points().get(group, [])
+
+
+class SchedulerRegistry:
+    """Name -> scheduler lookup with lazy imports and shared instances.
+
+    Schedulers are expected to be stateless between schedule() calls (all
+    per-run state lives in the ScheduleResult and the VMs passed in), so one
+    instance per algorithm is built on first use and reused across requests.
+    """
+
+    def __init__(self, builtins, group=ENTRY_POINT_GROUP):
+        self._targets = dict(builtins)
+        self._group = group
+        self._discovered = False
+        self._classes = {}
+        self._instances = {}
+        self._lock = threading.Lock()
+
+    def _discover(self):
+        if self._discovered:
+            return
+        with self._lock:
+            if not self._discovered:
+                for entry_point in _entry_points(self._group):
+                    # Built-ins win so a plugin cannot silently replace them
+                    self._targets.setdefault(entry_point.name, entry_point.value)
+                self._discovered = True
+
+    def register(self, name, target):
+        """Add a scheduler by class or "module:Class" target"""
+        with self._lock:
+            self._targets[name] = target
+            self._classes.pop(name, None)
+            self._instances.pop(name, None)
+
+    def names(self):
+        self._discover()
+        return list(self._targets)
+
+    def is_loaded(self, name):
+        return name in self._classes
+
+    def load(self, name):
+        """Import and return the scheduler class registered under name"""
+        self._discover()
+        if name not in self._targets:
+            raise KeyError(f"Unknown algorithm: {name}")
+        if name not in self._classes:
+            target = self._targets[name]
+            if isinstance(target, str):
+                module_name, _, attribute = target.partition(':')
+                target = getattr(importlib.import_module(module_name), attribute)
+            self._classes[name] = target
+        return self._classes[name]
+
+    def get(self, name, **options):
+        """Shared instance for name; options build a dedicated instance instead"""
+        if options:
+            return self.load(name)(**options)
+        if name not in self._instances:
+            scheduler_class = self.load(name)
+            with self._lock:
+                if name not in self._instances:
+                    self._instances[name] = scheduler_class()
+        return self._instances[name]
+
+
+registry = SchedulerRegistry(BUILTIN_SCHEDULERS)
@@ -0,0 +1,142 @@
+import numpy as np
+from config import UTILIZATION_FORMATS, DOWNSAMPLE_METHODS
+
+UTILIZATION_CHANNELS = ('cpu', 'ram', 'avg')
+
+
+def utilization_arrays(vms, max_time):
+    """Compute per-slot cluster CPU/RAM utilization (%) as NumPy arrays"""
+    cpu_used = np.zeros(max_time + 1)
+    ram_used = np.zeros(max_time + 1)
+    total_cpu = sum(vm.total_cpu for vm in vms)
+    total_ram = sum(vm.total_ram for vm in vms)
+
+    starts, ends, cpus, rams = [], [], [], []
+    for vm in vms:
+        for scheduled in vm.scheduled_tasks:
+            starts.append(scheduled['start_time'])
+            ends.append(scheduled['end_time'])
+            cpus.append(scheduled['task'].cpu_cores)
+            rams.append(scheduled['task'].ram_gb)
+
+    if starts:
+        # Difference array: +usage at start, -usage at end, then prefix-sum
+        starts = np.clip(np.asarray(starts, dtype=np.int64), 0, max_time)
+        ends = np.clip(np.asarray(ends, dtype=np.int64), 0, max_time)
+        np.add.at(cpu_used, starts, cpus)
+        np.add.at(cpu_used, ends, np.negative(cpus))
+        np.add.at(ram_used, starts, rams)
+        np.add.at(ram_used, ends, np.negative(rams))
+        cpu_used = np.cumsum(cpu_used)
+        ram_used = np.cumsum(ram_used)
+
+    cpu = cpu_used[:max_time] / total_cpu * 100 if total_cpu > 0 else np.zeros(max_time)
+    ram = ram_used[:max_time] / total_ram * 100 if total_ram > 0 else np.zeros(max_time)
+    return {
+        'time': np.arange(max_time),
+        'cpu': cpu,
+        'ram': ram,
+        'avg': (cpu + ram) / 2
+    }
+
+
+def lttb_indices(x, y, max_points):
+    """Largest-Triangle-Three-Buckets: indices of the points to keep"""
+    n = len(y)
+    if max_points >= n:
+        return np.arange(n)
+    if max_points < 3:
+        return np.linspace(0, n - 1, max(max_points, 1)).astype(np.int64)
+
+    # First and last points are always kept; the rest is split into buckets
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    # Average of each bucket, used as the third triangle vertex
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_x = np.append(sums_x / counts, x[n - 1])
+    avg_y = np.append(sums_y / counts, y[n - 1])
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    prev = 0
+    for bucket in range(max_points - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        ax, ay = x[prev], y[prev]
+        cx, cy = avg_x[bucket + 1], avg_y[bucket + 1]
+        areas = np.abs((ax - cx) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (cy - ay))
+        prev = lo + int(np.argmax(areas))
+        selected[bucket + 1] = prev
+    return selected
+
+
+def minmax_indices(y, max_points):
+    """Min/max bucketing: keep each bucket's extreme points, in time order"""
+    n = len(y)
+    if max_points >= n:
+        return np.arange(n)
+    buckets = max(max_points // 2, 1)
+
+    edges = np.linspace(0, n, buckets + 1).astype(np.int64)
+    # Pad buckets to equal width so argmin/argmax run over a single 2D array
+    width = int(np.max(np.diff(edges)))
+    offsets = edges[:-1, None] + np.arange(width)[None, :]
+    valid = offsets < edges[1:, None]
+    offsets = np.minimum(offsets, n - 1)
+    values = y[offsets]
+    lows = np.argmin(np.where(valid, values, np.inf), axis=1)
+    highs = np.argmax(np.where(valid, values, -np.inf), axis=1)
+    rows = np.arange(buckets)
+    return np.unique(np.concatenate([offsets[rows, lows], offsets[rows, highs]]))
+
+
+def downsample(arrays, max_points, method='lttb'):
+    """Reduce every channel to at most max_points samples, sharing one index set"""
+    n = len(arrays['time'])
+    if not max_points or max_points >= n:
+        return arrays
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unknown downsample method: {method}")
+
+    # The averaged channel drives point selection so cpu/ram stay aligned
+    x = arrays['time'].astype(float)
+    y = arrays['avg']
+    if method == 'lttb':
+        indices = lttb_indices(x, y, max_points)
+    else:
+        indices = minmax_indices(y, max_points)
+    return {key: values[indices] for key, values in arrays.items()}
+
+
+def encode(arrays, fmt='points', scale=10):
+    """Serialize utilization arrays in the requested response format"""
+    if fmt not in UTILIZATION_FORMATS:
+        raise ValueError(f"Unknown utilization format: {fmt}")
+
+    time = arrays['time'].astype(np.int64)
+    if fmt == 'points':
+        columns = [time.tolist()] + [arrays[c].tolist() for c in UTILIZATION_CHANNELS]
+        return [
+            {'time': t, 'cpu': cpu, 'ram': ram, 'avg': avg}
+            for t, cpu, ram, avg in zip(*columns)
+        ]
+    if fmt == 'columns':
+        encoded = {'time': time.tolist()}
+        encoded.update({c: arrays[c].tolist() for c in UTILIZATION_CHANNELS})
+        return encoded
+
+    # Quantized: integer percent * scale (e.g. 10 -> 0.1% resolution)
+    quantized = {c: np.rint(arrays[c] * scale).astype(np.int64) for c in UTILIZATION_CHANNELS}
+    if fmt == 'delta':
+        # First value followed by successive differences; decode with a cumulative sum
+        time = np.diff(time, prepend=0)
+        quantized = {c: np.diff(v, prepend=0) for c, v in quantized.items()}
+    encoded = {'format': fmt, 'scale': scale, 'time': time.tolist()}
+    encoded.update({c: v.tolist() for c, v in quantized.items()})
+    return encoded
+
+
+def format_utilization(arrays, max_points=None, fmt='points', method='lttb', scale=10):
+    """Downsample and encode a utilization series in one step"""
+    return encode(downsample(arrays, max_points, method), fmt, scale)
@@ -0,0 +1,205 @@
+import atexit
+import hashlib
+import json
+import queue
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import closing
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    case_type TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    inputs_hash TEXT NOT NULL,
+    vm_layout TEXT NOT NULL,
+    total_tasks INTEGER NOT NULL,
+    total_profit REAL NOT NULL,
+    completed_tasks INTEGER NOT NULL,
+    rejected_tasks INTEGER NOT NULL,
+    execution_time_ms REAL NOT NULL,
+    schedule_blob BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_runs_case_algorithm_time ON runs (case_type, algorithm, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_algorithm_time ON runs (algorithm, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_time ON runs (created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_inputs_hash ON runs (inputs_hash);
+"""
+
+INSERT_RUN = """
+INSERT INTO runs (created_at, case_type, algorithm, inputs_hash, vm_layout, total_tasks,
+                  total_profit, completed_tasks, rejected_tasks, execution_time_ms, schedule_blob)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+RUN_COLUMNS = ('id', 'created_at', 'case_type', 'algorithm', 'inputs_hash', 'vm_layout',
+               'total_tasks', 'total_profit', 'completed_tasks', 'rejected_tasks',
+               'execution_time_ms')
+
+# Nearest-rank percentiles: the smallest latency whose rank reaches p * count
+AGGREGATE_QUERY = """
+WITH ranked AS (
+    SELECT algorithm, total_profit, completed_tasks, execution_time_ms,
+           ROW_NUMBER() OVER (PARTITION BY algorithm ORDER BY execution_time_ms) AS rn,
+           COUNT(*) OVER (PARTITION BY algorithm) AS cnt
+    FROM runs {where}
+)
+SELECT algorithm,
+       COUNT(*) AS runs,
+       AVG(total_profit) AS avg_profit,
+       MAX(total_profit) AS max_profit,
+       AVG(completed_tasks) AS avg_completed_tasks,
+       AVG(execution_time_ms) AS avg_execution_time_ms,
+       MIN(CASE WHEN rn >= 0.50 * cnt THEN execution_time_ms END) AS p50_execution_time_ms,
+       MIN(CASE WHEN rn >= 0.95 * cnt THEN execution_time_ms END) AS p95_execution_time_ms
+FROM ranked
+GROUP BY algorithm
+ORDER BY algorithm
+"""
+
+
+def hash_inputs(tasks, vms):
+    """Stable hash of the task set and VM layout a run was scheduled on"""
+    payload = json.dumps({'tasks': [task.to_dict() for task in tasks], 'vms': vms},
+                         sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RunStore:
+    """SQLite (WAL) history of simulation runs.
+
+    record() only enqueues; a background thread serializes, compresses and
+    inserts queued runs in batches so the request path never waits on disk.
+    """
+
+    def __init__(self, path, batch_size=64, flush_interval=0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def _ensure_writer(self):
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._write_loop, name='run-store-writer',
+                                                    daemon=True)
+                    self._writer.start()
+                    atexit.register(self.flush)
+
+    def record(self, case_type, tasks, vms, results):
+        """Queue one row per algorithm result (dicts from ScheduleResult.to_dict)"""
+        self._ensure_writer()
+        self._queue.put((time.time(), case_type, tasks, vms, results))
+
+    def flush(self, timeout=5.0):
+        """Block until every queued run has been written"""
+        if self._writer is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def _rows_for(self, item):
+        created_at, case_type, tasks, vms, results = item
+        inputs_hash = hash_inputs(tasks, vms)
+        vm_layout = json.dumps(vms, separators=(',', ':'))
+        rows = []
+        for algorithm, result in results.items():
+            schedule = json.dumps(result['schedule'], separators=(',', ':'))
+            rows.append((created_at, case_type, algorithm, inputs_hash, vm_layout, len(tasks),
+                         result['total_profit'], result['completed_tasks'],
+                         result['rejected_tasks'], result['execution_time_ms'],
+                         zlib.compress(schedule.encode('utf-8'))))
+        return rows
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            item = self._queue.get()
+            batch, waiters = [], []
+            # Drain whatever else arrives within the flush window into one transaction
+            deadline = time.time() + self.flush_interval
+            while True:
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= self.batch_size or waiters:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.time(), 0))
+                except queue.Empty:
+                    break
+            try:
+                rows = [row for item in batch for row in self._rows_for(item)]
+                if rows:
+                    with conn:
+                        conn.executemany(INSERT_RUN, rows)
+            except Exception as e:
+                print(f"Error recording runs: {e}")
+            for waiter in waiters:
+                waiter.set()
+
+    def _filters(self, case_type=None, algorithm=None, since=None, until=None, inputs_hash=None):
+        clauses, params = [], []
+        for column, value in (('case_type', case_type), ('algorithm', algorithm),
+                              ('inputs_hash', inputs_hash)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        if since is not None:
+            clauses.append('created_at >= ?')
+            params.append(since)
+        if until is not None:
+            clauses.append('created_at < ?')
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return where, params
+
+    def list_runs(self, limit=100, offset=0, **filters):
+        """Most recent runs first, without the schedule blob"""
+        where, params = self._filters(**filters)
+        query = (f"SELECT {', '.join(RUN_COLUMNS)} FROM runs {where} "
+                 f"ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?")
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, params + [limit, offset]).fetchall()
+        runs = []
+        for row in rows:
+            run = dict(zip(RUN_COLUMNS, row))
+            run['vm_layout'] = json.loads(run['vm_layout'])
+            runs.append(run)
+        return runs
+
+    def aggregates(self, **filters):
+        """Per-algorithm profit and latency statistics (p50/p95 computed in SQL)"""
+        where, params = self._filters(**filters)
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(AGGREGATE_QUERY.format(where=where), params)
+            columns = [c[0] for c in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def get_run(self, run_id):
+        """Single run including its decompressed schedule"""
+        query = f"SELECT {', '.join(RUN_COLUMNS)}, schedule_blob FROM runs WHERE id = ?"
+        with closing(self._connect()) as conn:
+            row = conn.execute(query, (run_id,)).fetchone()
+        if row is None:
+            return None
+        run = dict(zip(RUN_COLUMNS, row[:-1]))
+        run['vm_layout'] = json.loads(run['vm_layout'])
+        run['schedule'] = json.loads(zlib.decompress(row[-1])) if row[-1] else []
+        return run
@@ -0,0 +1,95 @@
+import random
+import unittest
+import numpy as np
+from models.task import Task
+from models.virtual_machine import VirtualMachine
+from scheduler.exact.branch_and_bound import BranchAndBoundScheduler
+
+
+def random_instance(rng):
+    """A few small tasks with tight windows on one to three VMs"""
+    vms = [(rng.randint(2, 6), rng.randint(2, 10)) for _ in range(rng.randint(1, 3))]
+    tasks = []
+    for i in range(rng.randint(3, 6)):
+        arrival = rng.randint(0, 6)
+        duration = rng.randint(1, 4)
+        deadline = arrival + duration + rng.randint(-1, 4)
+        tasks.append(Task(f't{i}', arrival, rng.randint(1, 5), rng.randint(1, 9), duration,
+                          max(deadline, 1), 1, rng.randint(0, 50)))
+    return tasks, vms
+
+
+def brute_force(tasks, vms):
+    """Best total profit over every accept/VM/start combination"""
+    horizon = max(task.deadline for task in tasks)
+    free = [(np.full(horizon, cpu), np.full(horizon, ram)) for cpu, ram in vms]
+    best = 0
+
+    def place(index, profit):
+        nonlocal best
+        if index == len(tasks):
+            best = max(best, profit)
+            return
+        place(index + 1, profit)
+        task = tasks[index]
+        for free_cpu, free_ram in free:
+            for start in range(task.arrival_time, task.deadline - task.execution_time + 1):
+                slots = slice(start, start + task.execution_time)
+                if (free_cpu[slots] >= task.cpu_cores).all() and (free_ram[slots] >= task.ram_gb).all():
+                    free_cpu[slots] -= task.cpu_cores
+                    free_ram[slots] -= task.ram_gb
+                    place(index + 1, profit + task.profit)
+                    free_cpu[slots] += task.cpu_cores
+                    free_ram[slots] += task.ram_gb
+
+    place(0, 0)
+    return best
+
+
+def fleet(vms):
+    return [VirtualMachine(i + 1, cpu, ram) for i, (cpu, ram) in enumerate(vms)]
+
+
+class BranchAndBoundTest(unittest.TestCase):
+    def assert_feasible(self, result, vms):
+        capacity = {i + 1: vm for i, vm in enumerate(vms)}
+        for entry in result.schedule:
+            task = entry['task']
+            self.assertGreaterEqual(entry['start_time'], task.arrival_time)
+            self.assertLessEqual(entry['end_time'], task.deadline)
+            for slot in range(entry['start_time'], entry['end_time']):
+                running = [e['task'] for e in result.schedule
+                           if e['vm_id'] == entry['vm_id'] and e['start_time'] <= slot < e['end_time']]
+                cpu, ram = capacity[entry['vm_id']]
+                self.assertLessEqual(sum(t.cpu_cores for t in running), cpu)
+                self.assertLessEqual(sum(t.ram_gb for t in running), ram)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        scheduler = BranchAndBoundScheduler(time_limit_ms=60000)
+        for _ in range(150):
+            tasks, vms = random_instance(rng)
+            result = scheduler.schedule(tasks, fleet(vms))
+            self.assertEqual(result.total_profit, brute_force(tasks, vms))
+            self.assertTrue(result.optimality['proven_optimal'])
+            self.assert_feasible(result, vms)
+
+    def test_bound_holds_when_timed_out(self):
+        rng = random.Random(11)
+        scheduler = BranchAndBoundScheduler(time_limit_ms=0.01)
+        for _ in range(50):
+            tasks, vms = random_instance(rng)
+            result = scheduler.schedule(tasks, fleet(vms))
+            optimum = brute_force(tasks, vms)
+            self.assertLessEqual(result.total_profit, optimum)
+            self.assertGreaterEqual(result.optimality['upper_bound'] + 1e-6, optimum)
+            self.assert_feasible(result, vms)
+
+    def test_rejects_oversized_input(self):
+        tasks = [Task(f't{i}', 0, 1, 1, 1, 10000, 1, 1) for i in range(100)]
+        with self.assertRaises(ValueError):
+            BranchAndBoundScheduler().schedule(tasks, fleet([(4, 8)]))
+
+
+if __name__ == '__main__':
+    unittest.main()